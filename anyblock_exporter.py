@@ -19,6 +19,9 @@ def main():
     output_folder = args.output_folder or config.get('output_folder', 'markdown_files')
     log_level = args.log_level or config.get('log_level', 'INFO')
     log_file = config.get('log_file', 'anytype_conversion.log')
+    index_database = args.index_database or config.get('index_database')
+    rebuild_index = args.rebuild_index or config.get('rebuild_index', False)
+    search_index_database = args.search_index_database or config.get('search_index_database')
 
     # Setup logging
     setup_logger(log_level, log_file)
@@ -36,7 +39,7 @@ def main():
 
     try:
         # Initialize and run the converter
-        converter = AnytypeConverter(input_folder, output_folder)
+        converter = AnytypeConverter(input_folder, output_folder, index_database, rebuild_index, search_index_database)
         converter.process_all_files()
 
         logger.info("Conversion completed successfully")
@@ -7,7 +7,9 @@ from .converter import AnytypeConverter
 from .block_converter import convert_block_to_markdown
 from .relation_handler import RelationHandler
 from .file_handler import FileHandler
-from .utils import format_inline_text, convert_table_to_markdown, format_latex_equation, sanitize_filename
+from .index_store import IndexStore
+from .search_index import SearchIndex
+from .utils import format_inline_text, convert_table_to_markdown, format_latex_equation, sanitize_filename, scan_json_files, split_frontmatter
 
 # You can also define a version number for your package
 __version__ = "0.1.0"
\ No newline at end of file
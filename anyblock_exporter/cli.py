@@ -12,4 +12,10 @@ def parse_arguments():
     parser.add_argument("--log_level", default=Config.LOG_LEVEL, 
                         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'],
                         help="Set the logging level")
+    parser.add_argument("--index_database", default=None,
+                        help="Path to a SQLite database used to index the export on disk instead of in memory")
+    parser.add_argument("--rebuild_index", action='store_true',
+                        help="Rebuild the index database even if it was already built for the input folder")
+    parser.add_argument("--search_index_database", default=None,
+                        help="Path to a SQLite database to fill with a full-text search index of the converted pages")
     return parser.parse_args()
\ No newline at end of file
@@ -6,86 +6,129 @@ import logging
 import traceback
 import chardet
 from tqdm import tqdm
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 from anyblock_exporter.block_converter import process_blocks, convert_block_to_markdown
-from anyblock_exporter.utils import sanitize_filename
+from anyblock_exporter.utils import sanitize_filename, scan_json_files, split_frontmatter, JsonFileEntry
 from anyblock_exporter.relation_handler import RelationHandler
 from anyblock_exporter.file_handler import FileHandler
-from anyblock_exporter.exceptions import JSONReadError
+from anyblock_exporter.index_store import IndexStore
+from anyblock_exporter.search_index import SearchIndex
+from anyblock_exporter.exceptions import JSONReadError, SearchIndexError
 from datetime import datetime
 
 
 
 class AnytypeConverter:
-    def __init__(self, input_folder: str, output_folder: str):
+    def __init__(self, input_folder: str, output_folder: str, index_database: Optional[str] = None, rebuild_index: bool = False, search_index_database: Optional[str] = None):
         self.input_folder = input_folder
         self.output_folder = output_folder
         self.attachments_folder = os.path.join(output_folder, 'attachments')
-        self.json_objects = []  # This will store all the JSON objects
+        self.json_objects = []  # This will store all the JSON objects, unless an index database is used
+        self.input_files: List[JsonFileEntry] = []  # Filled by a single scan of input_folder on every run, largest files first
+        self.index = IndexStore(index_database) if index_database else None
+        self.rebuild_index = rebuild_index
+        try:
+            self.search_index = SearchIndex(search_index_database) if search_index_database else None
+        except SearchIndexError:
+            if self.index is not None:
+                self.index.close()
+            raise
         self.relation_handler = None  # Initialize later after reading JSON files
         self.file_handler = FileHandler(self.attachments_folder)
         self.logger = logging.getLogger("anyblock_exporter")
 
+    def load_json_file(self, file_path: str) -> Optional[Dict[str, Any]]:
+        try:
+            # Try reading with default encoding (utf-8)
+            with open(file_path, 'r', encoding='utf-8') as file:
+                return json.load(file)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            self.logger.warning(f"Error decoding JSON in file {file_path} with default encoding: {str(e)}")
+            try:
+                # Detect encoding for files that fail with default encoding
+                with open(file_path, 'rb') as file:
+                    raw_data = file.read()
+                    result = chardet.detect(raw_data)
+                    encoding = result['encoding']
+                
+                # Read file with detected encoding
+                with open(file_path, 'r', encoding=encoding) as file:
+                    json_data = json.load(file)
+                    self.logger.info(f"Successfully read file {file_path} with detected encoding: {encoding}")
+                    return json_data
+            except (json.JSONDecodeError, IOError) as e:
+                self.logger.error(f"Error decoding JSON in file {file_path} with detected encoding: {str(e)}")
+            except Exception as e:
+                self.logger.error(f"An error occurred while reading file {file_path}: {str(e)}")
+        except OSError as e:
+            self.logger.error(f"Error opening file {file_path}: {str(e)}")
+        return None
+
     def read_json_files(self) -> None:
         try:
-            # Count total number of files to process
-            total_files = sum([len(files) for _, _, files in os.walk(self.input_folder)])
-            
-            # Initialize progress bar
-            pbar = tqdm(total=total_files, desc="Processing files", unit="file")
-            
-            for root, dirs, files in os.walk(self.input_folder):
-                for filename in files:
-                    if filename.endswith('.json'):
-                        file_path = os.path.join(root, filename)
-                        try:
-                            # Try reading with default encoding (utf-8)
-                            with open(file_path, 'r', encoding='utf-8') as file:
-                                json_data = json.load(file)
-                                self.json_objects.append(json_data)
-                        except (json.JSONDecodeError, UnicodeDecodeError) as e:
-                            self.logger.warning(f"Error decoding JSON in file {file_path} with default encoding: {str(e)}")
-                            try:
-                                # Detect encoding for files that fail with default encoding
-                                with open(file_path, 'rb') as file:
-                                    raw_data = file.read()
-                                    result = chardet.detect(raw_data)
-                                    encoding = result['encoding']
-                                
-                                # Read file with detected encoding
-                                with open(file_path, 'r', encoding=encoding) as file:
-                                    json_data = json.load(file)
-                                    self.json_objects.append(json_data)
-                                    self.logger.info(f"Successfully read file {file_path} with detected encoding: {encoding}")
-                            except (json.JSONDecodeError, IOError) as e:
-                                self.logger.error(f"Error decoding JSON in file {file_path} with detected encoding: {str(e)}")
-                            except Exception as e:
-                                self.logger.error(f"An error occurred while reading file {file_path}: {str(e)}")
-                        
-                        # Update progress bar
-                        pbar.update(1)
-            
-            # Close progress bar
-            pbar.close()
+            # Scan once for JSON files, so the progress total is exact and later stages can reuse the list
+            self.input_files = scan_json_files(self.input_folder)
+
+            if self.index is not None and not self.rebuild_index and self.index.is_built_for(self.input_folder, self.input_files):
+                # Reuse the index from a previous run and skip the indexing pass
+                self.logger.info(f"Reusing index database: {self.index.database_path}")
+            else:
+                if self.index is not None:
+                    self.index.clear()
+
+                # Initialize progress bar
+                pbar = tqdm(total=len(self.input_files), desc="Processing files", unit="file")
+                
+                for input_file in self.input_files:
+                    json_data = self.load_json_file(input_file.path)
+                    if json_data is not None:
+                        if self.index is not None:
+                            self.index.add_object(json_data, input_file)
+                        else:
+                            self.json_objects.append(json_data)
+                    elif self.index is not None:
+                        self.index.add_unreadable_file(input_file)
+                    
+                    # Update progress bar
+                    pbar.update(1)
+                
+                # Close progress bar
+                pbar.close()
+
+                if self.index is not None:
+                    self.index.mark_built(self.input_folder)
             
-            if not self.json_objects:
+            object_count = self.index.count_objects() if self.index is not None else len(self.json_objects)
+            if not object_count:
                 raise JSONReadError("No valid JSON files were read")
             
-            self.logger.info(f"Read {len(self.json_objects)} JSON files")
+            self.logger.info(f"Read {object_count} JSON files")
 
             # Initialize RelationHandler after reading JSON files
-            self.relation_handler = RelationHandler(self.json_objects)
+            self.relation_handler = RelationHandler(self.json_objects, self.index)
         except Exception as e:
             self.logger.error(f"An error occurred while reading JSON files: {str(e)}")
             self.logger.error(traceback.format_exc()) # more detailed error traceback
 
 
-    def identify_main_content_files(self) -> List[Dict[str, Any]]:
+    def identify_main_content_files(self) -> Iterable[Dict[str, Any]]:
+        if self.index is not None:
+            if not self.index.count_objects('Page'):
+                self.logger.error("No main content files found")
+            return self.iter_indexed_main_contents()
+
         main_contents = [obj for obj in self.json_objects if obj.get('sbType') == 'Page']
         if not main_contents:
             self.logger.error("No main content files found")
         return main_contents
 
+    def iter_indexed_main_contents(self) -> Iterator[Dict[str, Any]]:
+        """Loads pages one at a time from the paths recorded in the index."""
+        for file_path in self.index.iter_file_paths('Page'):
+            main_content = self.load_json_file(file_path)
+            if main_content is not None:
+                yield main_content
+
     def extract_creation_date(self, main_content: Dict[str, Any]) -> str:
         try:
             created_date = main_content['snapshot']['data']['details'].get('createdDate')
@@ -141,7 +184,8 @@ class AnytypeConverter:
 
         return markdown_content
         
-    def write_markdown_file(self, content: str, filename: str) -> None:
+    def write_markdown_file(self, content: str, filename: str) -> Optional[Tuple[str, str]]:
+        """Writes the Markdown file and returns the path and final content written, or None if it could not be written."""
         try:
             os.makedirs(self.output_folder, exist_ok=True)
             
@@ -199,6 +243,7 @@ class AnytypeConverter:
             with open(file_path, 'w', encoding='utf-8') as file:
                 file.write(content)
             self.logger.info(f"Markdown file created: {file_path}")
+            return file_path, content
         except Exception as e:
             self.logger.error(f"Error writing Markdown file '{filename}': {str(e)}")
             fallback_filename = "untitled.md"
@@ -214,6 +259,7 @@ class AnytypeConverter:
                 with open(fallback_path, 'w', encoding='utf-8') as file:
                     file.write(content)
                 self.logger.info(f"Fallback Markdown file created: {fallback_path}")
+                return fallback_path, content
             except Exception as e:
                 self.logger.error(f"Failed to create fallback file: {str(e)}")
 
@@ -226,10 +272,22 @@ class AnytypeConverter:
                 try:
                     self.logger.debug(f"Processing content: {main_content.get('id', 'Unknown ID')}")
                     markdown_content = self.compile_markdown(main_content)
-                    title = main_content['snapshot']['data']['details'].get('name', 'Untitled')
-                    self.write_markdown_file(markdown_content, title)
+                    details = main_content['snapshot']['data']['details']
+                    title = details.get('name', 'Untitled')
+                    written = self.write_markdown_file(markdown_content, title)
+                    if self.search_index is not None and written:
+                        # Index the page in the same pass instead of re-reading the written file
+                        output_path, written_content = written
+                        page_id = details.get('id', main_content.get('id', output_path))
+                        frontmatter, body = split_frontmatter(written_content)
+                        self.search_index.add_page(page_id, output_path, title, frontmatter, body)
                 except Exception as e:
                     self.logger.error(f"Error processing file {main_content.get('id', 'Unknown ID')}: {str(e)}")
             self.file_handler.copy_all_files()
         except Exception as e:
-            self.logger.error(f"Error in process_all_files: {str(e)}")
\ No newline at end of file
+            self.logger.error(f"Error in process_all_files: {str(e)}")
+        finally:
+            if self.index is not None:
+                self.index.close()
+            if self.search_index is not None:
+                self.search_index.close()
\ No newline at end of file
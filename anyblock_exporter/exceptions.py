@@ -5,4 +5,8 @@ class AnytypeConverterError(Exception):
 
 class JSONReadError(AnytypeConverterError):
     """Raised when there's an error reading JSON files."""
-    pass
\ No newline at end of file
+    pass
+
+class SearchIndexError(AnytypeConverterError):
+    """Raised when the full-text search index cannot be created."""
+    pass
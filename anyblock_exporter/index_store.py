@@ -0,0 +1,139 @@
+# index_store.py
+
+import os
+import json
+import sqlite3
+import logging
+from typing import Dict, Any, Iterator, List, Optional
+from .utils import JsonFileEntry
+
+class IndexStore:
+    """SQLite-backed index of an Anytype export, used instead of keeping every JSON object in memory."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+        CREATE TABLE IF NOT EXISTS objects (
+            id TEXT,
+            sb_type TEXT,
+            file_path TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime REAL NOT NULL,
+            loaded INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_objects_id ON objects (id);
+        CREATE INDEX IF NOT EXISTS idx_objects_sb_type ON objects (sb_type);
+        CREATE TABLE IF NOT EXISTS relations (
+            relation_key TEXT PRIMARY KEY,
+            relation_format INTEGER,
+            details TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS relation_options (
+            id TEXT PRIMARY KEY,
+            name TEXT
+        );
+    """
+
+    def __init__(self, database_path: str):
+        self.database_path = database_path
+        self.logger = logging.getLogger("anyblock_exporter")
+        database_dir = os.path.dirname(os.path.abspath(database_path))
+        os.makedirs(database_dir, exist_ok=True)
+        self.connection = sqlite3.connect(database_path)
+        self.connection.executescript(self.SCHEMA)
+
+    def is_built_for(self, input_folder: str, input_files: List[JsonFileEntry]) -> bool:
+        """Checks if the index was fully built from the given input folder and none of its files changed since."""
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'input_folder'").fetchone()
+        if row is None or row[0] != os.path.abspath(input_folder):
+            return False
+        indexed = {
+            file_path: (size, mtime)
+            for file_path, size, mtime in self.connection.execute("SELECT file_path, size, mtime FROM objects")
+        }
+        scanned = {os.path.abspath(f.path): (f.size, f.mtime) for f in input_files}
+        return indexed == scanned
+
+    def clear(self) -> None:
+        with self.connection:
+            self.connection.execute("DELETE FROM meta")
+            self.connection.execute("DELETE FROM objects")
+            self.connection.execute("DELETE FROM relations")
+            self.connection.execute("DELETE FROM relation_options")
+
+    def add_object(self, json_data: Dict[str, Any], input_file: JsonFileEntry) -> None:
+        """Indexes the metadata of one JSON object. The full object stays on disk at input_file.path."""
+        sb_type = json_data.get('sbType')
+        details = json_data.get('snapshot', {}).get('data', {}).get('details', {})
+        object_id = details.get('id', json_data.get('id'))
+
+        self.connection.execute(
+            "INSERT INTO objects (id, sb_type, file_path, size, mtime, loaded) VALUES (?, ?, ?, ?, ?, 1)",
+            (object_id, sb_type, os.path.abspath(input_file.path), input_file.size, input_file.mtime)
+        )
+        if sb_type == 'STRelation' and details.get('relationKey') is not None:
+            # Keep the first definition seen, matching the in-memory lookup
+            self.connection.execute(
+                "INSERT OR IGNORE INTO relations (relation_key, relation_format, details) VALUES (?, ?, ?)",
+                (details['relationKey'], details.get('relationFormat'), json.dumps(details))
+            )
+        elif sb_type == 'STRelationOption' and details.get('id') is not None:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO relation_options (id, name) VALUES (?, ?)",
+                (details['id'], details.get('name'))
+            )
+
+    def add_unreadable_file(self, input_file: JsonFileEntry) -> None:
+        """Records a file that could not be loaded, so it does not count as a change on the next run."""
+        self.connection.execute(
+            "INSERT INTO objects (id, sb_type, file_path, size, mtime, loaded) VALUES (NULL, NULL, ?, ?, ?, 0)",
+            (os.path.abspath(input_file.path), input_file.size, input_file.mtime)
+        )
+
+    def mark_built(self, input_folder: str) -> None:
+        """Records that indexing finished, so later runs against the same folder can reuse it."""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('input_folder', ?)",
+                (os.path.abspath(input_folder),)
+            )
+
+    def count_objects(self, sb_type: Optional[str] = None) -> int:
+        if sb_type is None:
+            return self.connection.execute("SELECT COUNT(*) FROM objects WHERE loaded = 1").fetchone()[0]
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM objects WHERE sb_type = ?", (sb_type,)
+        ).fetchone()[0]
+
+    def iter_file_paths(self, sb_type: str) -> Iterator[str]:
+        cursor = self.connection.execute(
+            "SELECT file_path FROM objects WHERE sb_type = ? ORDER BY rowid", (sb_type,)
+        )
+        for (file_path,) in cursor:
+            yield file_path
+
+    def get_relation_info(self, relation_key: str) -> Optional[Dict[str, Any]]:
+        row = self.connection.execute(
+            "SELECT details FROM relations WHERE relation_key = ?", (relation_key,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def relation_has_options(self, relation_key: str) -> bool:
+        row = self.connection.execute(
+            "SELECT relation_format FROM relations WHERE relation_key = ?", (relation_key,)
+        ).fetchone()
+        # relationFormat 0 indicates free-form text
+        return row is not None and row[0] != 0
+
+    def get_relation_option_name(self, option_id: str) -> Optional[str]:
+        row = self.connection.execute(
+            "SELECT name FROM relation_options WHERE id = ?", (option_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return row[0] if row[0] is not None else option_id
+
+    def close(self) -> None:
+        self.connection.close()
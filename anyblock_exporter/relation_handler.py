@@ -1,11 +1,13 @@
 import logging
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime, timedelta
 from .config_loader import config
+from .index_store import IndexStore
 
 class RelationHandler:
-    def __init__(self, json_objects: List[Dict[str, Any]]):
+    def __init__(self, json_objects: List[Dict[str, Any]], index: Optional[IndexStore] = None):
         self.json_objects = json_objects
+        self.index = index  # When set, lookups query the SQLite index instead of json_objects
         self.relation_cache = {}
         self.reference_date = datetime(2001, 1, 1)  # Reference date: January 1, 2001
         self.decode_timestamps = config.get('decode_timestamps', True)
@@ -75,6 +77,8 @@ class RelationHandler:
 
     def relation_has_options(self, relation_key: str) -> bool:
         """Checks if a relation has pre-defined options."""
+        if self.index is not None:
+            return self.index.relation_has_options(relation_key)
         for obj in self.json_objects:
             if obj.get('sbType') == 'STRelation' and obj['snapshot']['data']['details'].get('relationKey') == relation_key:
                 # Check if relationFormat is 0, indicating free-form text
@@ -88,6 +92,14 @@ class RelationHandler:
         if relation_key in self.relation_cache:
             return self.relation_cache[relation_key]
 
+        if self.index is not None:
+            relation_info = self.index.get_relation_info(relation_key)
+            if relation_info is not None:
+                self.relation_cache[relation_key] = relation_info
+                return relation_info
+            self.logger.warning(f"Relation info not found for key: {relation_key}")
+            return {}
+
         for obj in self.json_objects:
             if obj.get('sbType') == 'STRelation' and obj['snapshot']['data']['details'].get('relationKey') == relation_key:
                 self.relation_cache[relation_key] = obj['snapshot']['data']['details']
@@ -98,6 +110,9 @@ class RelationHandler:
 
     def get_relation_option_name(self, option_id: str) -> str:
         """Retrieves the name of a relation option given its ID."""
+        if self.index is not None:
+            option_name = self.index.get_relation_option_name(option_id) if isinstance(option_id, str) else None
+            return option_name if option_name is not None else str(option_id)
         for obj in self.json_objects:
             if obj.get('sbType') == 'STRelationOption' and obj['snapshot']['data']['details'].get('id') == option_id:
                 return obj['snapshot']['data']['details'].get('name', option_id)
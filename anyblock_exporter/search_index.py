@@ -0,0 +1,63 @@
+# search_index.py
+
+import os
+import sqlite3
+import logging
+from typing import List
+from .exceptions import SearchIndexError
+
+class SearchIndex:
+    """SQLite FTS5 full-text index of converted pages, filled during conversion."""
+
+    # pages holds the rows keyed by page_id; pages_fts indexes them as an external-content
+    # table, kept in sync by the triggers so replacing a page never scans the FTS table
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS pages (
+            id INTEGER PRIMARY KEY,
+            page_id TEXT NOT NULL UNIQUE,
+            output_path TEXT NOT NULL,
+            title TEXT,
+            relations TEXT,
+            content TEXT
+        );
+        CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5(
+            title,
+            relations,
+            content,
+            content='pages',
+            content_rowid='id'
+        );
+        CREATE TRIGGER IF NOT EXISTS pages_ai AFTER INSERT ON pages BEGIN
+            INSERT INTO pages_fts (rowid, title, relations, content)
+            VALUES (new.id, new.title, new.relations, new.content);
+        END;
+        CREATE TRIGGER IF NOT EXISTS pages_ad AFTER DELETE ON pages BEGIN
+            INSERT INTO pages_fts (pages_fts, rowid, title, relations, content)
+            VALUES ('delete', old.id, old.title, old.relations, old.content);
+        END;
+    """
+
+    def __init__(self, database_path: str):
+        self.database_path = database_path
+        self.logger = logging.getLogger("anyblock_exporter")
+        database_dir = os.path.dirname(os.path.abspath(database_path))
+        os.makedirs(database_dir, exist_ok=True)
+        self.connection = sqlite3.connect(database_path)
+        try:
+            self.connection.executescript(self.SCHEMA)
+        except sqlite3.OperationalError as e:
+            self.connection.close()
+            raise SearchIndexError(f"Could not create search index in {database_path} (is FTS5 available?): {str(e)}")
+
+    def add_page(self, page_id: str, output_path: str, title: str, relations: List[str], content: str) -> None:
+        """Adds a page, replacing any row left by an earlier conversion of the same page."""
+        self.connection.execute("DELETE FROM pages WHERE page_id = ?", (page_id,))
+        self.connection.execute(
+            "INSERT INTO pages (page_id, output_path, title, relations, content) VALUES (?, ?, ?, ?, ?)",
+            (page_id, os.path.abspath(output_path), title, "\n".join(relations), content)
+        )
+        self.logger.debug(f"Added page to search index: {page_id}")
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
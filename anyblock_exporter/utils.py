@@ -1,9 +1,53 @@
 # utils.py
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Tuple
 import re
 import unicodedata
 import os
+import logging
+
+LOGGER = logging.getLogger("anyblock_exporter")
+
+class JsonFileEntry(NamedTuple):
+    path: str
+    size: int
+    mtime: float
+
+def scan_json_files(folder: str) -> List[JsonFileEntry]:
+    """Collects every JSON file under folder in one pass, largest first so the biggest files are never left for last."""
+    entries = []
+    pending = [folder]
+    while pending:
+        directory = pending.pop()
+        try:
+            it = os.scandir(directory)
+        except OSError as e:
+            # Skip unreadable directories, like os.walk does
+            LOGGER.warning(f"Could not scan directory {directory}: {str(e)}")
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.name.endswith('.json') and entry.is_file():
+                        stat = entry.stat()
+                        entries.append(JsonFileEntry(entry.path, stat.st_size, stat.st_mtime))
+                except OSError as e:
+                    LOGGER.warning(f"Could not read file info for {entry.path}: {str(e)}")
+    entries.sort(key=lambda e: (-e.size, e.path))
+    return entries
+
+def split_frontmatter(content: str) -> Tuple[List[str], str]:
+    """Splits Markdown content into its frontmatter lines and the body that follows."""
+    lines = content.split('\n')
+    if content.startswith('---'):
+        try:
+            frontmatter_end = lines.index('---', 1)
+            return lines[1:frontmatter_end], '\n'.join(lines[frontmatter_end+1:]).lstrip('\n')
+        except ValueError:
+            pass
+    return [], content
 
 def sanitize_filename(filename: str, max_length: int = 150) -> str:
     if not filename.strip():